@@ -62,11 +62,11 @@ class RAGE_CollisionSystem:
             # Apply scale/rotation before decimation for predictable results
             bpy.ops.object.transform_apply(location=False, rotation=True, scale=True)
 
-            bpy.ops.object.modifier_add(type='DECIMATE')
-            collision_obj.modifiers["Decimate"].ratio = 0.3
+            decimate_mod = collision_obj.modifiers.new(name="Decimate", type='DECIMATE')
+            decimate_mod.ratio = 0.3
             # Apply the modifier
             try:
-                bpy.ops.object.modifier_apply(modifier="Decimate")
+                bpy.ops.object.modifier_apply(modifier=decimate_mod.name)
             except RuntimeError as e:
                 print(f"Warning: Could not apply Decimate modifier to {collision_obj.name}. Error: {e}")
            
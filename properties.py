@@ -1,4 +1,6 @@
 import bpy
+import os
+import time
 from bpy.types import PropertyGroup
 from bpy.props import (StringProperty, BoolProperty, IntProperty,
                       FloatProperty, FloatVectorProperty, EnumProperty,
@@ -11,6 +13,23 @@ GAME_TYPES = [
     ('GTAV', 'Grand Theft Auto V', 'GTA V PC modding tools', 2)
 ]
 
+# Directory existence checks keyed by path: (checked_at, exists); panels redraw many times a second
+PATH_EXISTS_TTL = 2.0
+_path_exists_cache = {}
+
+def cached_path_exists(path: str) -> bool:
+    """Professional os.path.exists with a short TTL so panel redraws don't stat on every draw"""
+    now = time.monotonic()
+    entry = _path_exists_cache.get(path)
+    if entry is None or now - entry[0] >= PATH_EXISTS_TTL:
+        entry = (now, os.path.exists(path))
+        _path_exists_cache[path] = entry
+    return entry[1]
+
+def _invalidate_path_cache(self, context):
+    """Drop cached directory checks when a directory setting changes"""
+    _path_exists_cache.clear()
+
 class RAGEExportSettings(PropertyGroup):
     # Game selection
     game_type: EnumProperty(
@@ -285,21 +304,24 @@ class RAGEStudioProperties(PropertyGroup):
         name="Game Directory",
         description="Path to RAGE game installation",
         default="",
-        subtype='DIR_PATH'
+        subtype='DIR_PATH',
+        update=_invalidate_path_cache
     )
    
     export_path: StringProperty(
         name="Export Path",
         description="Default export directory",
         default="",
-        subtype='DIR_PATH'
+        subtype='DIR_PATH',
+        update=_invalidate_path_cache
     )
    
     codewalker_directory: StringProperty(
         name="CodeWalker Directory",
         description="Path to CodeWalker installation",
         default="",
-        subtype='DIR_PATH'
+        subtype='DIR_PATH',
+        update=_invalidate_path_cache
     )
    
     # Asset browser
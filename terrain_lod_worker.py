@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# =============================================================================
+# RAGE Studio Terrain LOD Worker
+# Headless NumPy-only mesh builder for terrain LOD levels
+# Runs outside Blender so LOD levels can be built in parallel processes
+# =============================================================================
+
+import sys
+import numpy as np
+
+# Quads per face strip: a strip row touches width + 1 vertices per edge, so 7 quads keep
+# two consecutive rows inside a 16-entry FIFO post-transform vertex cache
+FACE_STRIP_WIDTH = 7
+
+def block_average(height_data: np.ndarray, factor: int) -> np.ndarray:
+    """Professional block-average downsampling (factor x factor pixels per sample)"""
+    if factor == 1:
+        return np.asarray(height_data, dtype=np.float32)
+   
+    rows = height_data.shape[0] // factor
+    cols = height_data.shape[1] // factor
+    trimmed = height_data[:rows * factor, :cols * factor]
+   
+    return trimmed.reshape(rows, factor, cols, factor).mean(axis=(1, 3), dtype=np.float32)
+
+def grid_mesh_arrays(height_data: np.ndarray, resolution: int, factor: int):
+    """Professional LOD grid arrays: (V, 3) verts, (F, 4) quads and (V, 2) per-vertex UVs.
+   
+    Samples sit at the centre of their source block, in the same local space as the
+    full-resolution terrain (vertex (col, row) at col - res/2, row - res/2).
+    """
+    lod_height = block_average(height_data, factor)
+    rows, cols = lod_height.shape
+    offset = (factor - 1) / 2 - resolution / 2
+   
+    x_coords = np.arange(cols, dtype=np.float32) * factor + offset
+    y_coords = np.arange(rows, dtype=np.float32) * factor + offset
+   
+    # Professional in-place fill: UVs are derived from the positions without temporaries
+    verts = np.empty((rows, cols, 3), dtype=np.float32)
+    verts[..., 0] = x_coords
+    verts[..., 1] = y_coords[:, None]
+    verts[..., 2] = lod_height
+    uvs = np.add(verts[..., :2], resolution / 2, dtype=np.float32)
+    uvs /= resolution
+   
+    # Professional quad indices matching the full-resolution winding
+    index = np.arange(rows * cols, dtype=np.int32).reshape(rows, cols)
+    faces = np.stack((index[:-1, :-1], index[:-1, 1:], index[1:, 1:], index[1:, :-1]), axis=-1)
+   
+    # Professional vertex-cache ordering: emit quads in narrow column strips walked row by row,
+    # so each row of a strip reuses the vertices its previous row just transformed
+    strips = [faces[:, start:start + FACE_STRIP_WIDTH].reshape(-1, 4)
+              for start in range(0, faces.shape[1], FACE_STRIP_WIDTH)]
+    faces = np.concatenate(strips) if strips else faces.reshape(-1, 4)
+   
+    return verts.reshape(-1, 3), faces, uvs.reshape(-1, 2)
+
+def main(argv=None) -> int:
+    """Worker entry point: <height.npy> <resolution> <factor> <output.npz>"""
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 4:
+        print("Usage: terrain_lod_worker.py <height.npy> <resolution> <factor> <output.npz>")
+        return 2
+   
+    height_path, resolution, factor, output_path = argv
+    height_data = np.load(height_path, mmap_mode='r')
+    verts, faces, uvs = grid_mesh_arrays(height_data, int(resolution), int(factor))
+    np.savez(output_path, verts=verts, faces=faces, uvs=uvs)
+   
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,317 @@
 import bpy
-import bmesh
 import numpy as np
 import os
+import sys
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from mathutils import Vector, Matrix, noise
 from bpy.types import Operator, Panel, PropertyGroup
 from bpy.props import (StringProperty, BoolProperty, IntProperty,
                        FloatProperty, FloatVectorProperty, EnumProperty,
                        PointerProperty)
 from bpy_extras.io_utils import ImportHelper
+from .terrain_lod_worker import block_average, grid_mesh_arrays
+
+# Optional third-party imports for fast heightmap decoding
+try:
+    import imageio.v3 as iio
+    HAS_IMAGEIO = True
+except ImportError:
+    HAS_IMAGEIO = False
+
+try:
+    import cv2
+    HAS_CV2 = True
+except ImportError:
+    HAS_CV2 = False
+
+# Optional JIT compilation for large-array kernels
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Raw heightmaps are headerless square grids of little-endian 16-bit samples
+RAW_HEIGHTMAP_EXTENSIONS = {'.raw', '.r16'}
+
+# Industry-standard Rec. 601 luminance weights, float32 so they never promote height data to float64
+LUMINANCE_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+# Principled BSDF inputs renamed in Blender 4.0 (old name -> new name)
+_BSDF_SOCKET_ALIASES = {'Specular': 'Specular IOR Level', 'Transmission': 'Transmission Weight'}
+
+# Principled BSDF input name -> socket index, filled from the first node seen
+_bsdf_socket_indices = {}
+
+# Headless NumPy worker used to build terrain LOD levels in parallel processes
+LOD_WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "terrain_lod_worker.py")
+
+# Below this grid resolution LODs are cheaper to build in-process than to start worker interpreters
+LOD_WORKER_MIN_RESOLUTION = 2048
+def _fast_mesh_build(mesh: bpy.types.Mesh, verts: np.ndarray, faces, uvs: np.ndarray = None):
+    """Professional bulk mesh upload from vertex and face index arrays.
+   
+    ``faces`` is one (F, K) index array, or a sequence of them when the
+    mesh mixes polygon sizes (e.g. quad sides with n-gon caps). Optional
+    ``uvs`` are (V, 2) per-vertex coordinates written to the "UVMap" UV layer.
+    """
+    if isinstance(faces, np.ndarray):
+        faces = (faces,)
+    loop_totals = np.concatenate([np.full(len(block), block.shape[1], dtype=np.int32) for block in faces])
+    loop_indices = np.concatenate([block.ravel() for block in faces]).astype(np.int32, copy=False)
+    loop_starts = np.zeros(len(loop_totals), dtype=np.int32)
+    np.cumsum(loop_totals[:-1], out=loop_starts[1:])
+   
+    # Professional bulk upload (one C call per attribute)
+    mesh.vertices.add(len(verts))
+    mesh.vertices.foreach_set("co", np.asarray(verts, dtype=np.float32).ravel())
+    mesh.loops.add(len(loop_indices))
+    mesh.loops.foreach_set("vertex_index", loop_indices)
+    mesh.polygons.add(len(loop_totals))
+    mesh.polygons.foreach_set("loop_start", loop_starts)
+    if bpy.app.version < (4, 0, 0):
+        mesh.polygons.foreach_set("loop_total", loop_totals)
+   
+    # Professional UV map: per-vertex UVs gathered to loop order in one NumPy pass
+    if uvs is not None:
+        uv_layer = mesh.uv_layers.new(name="UVMap")
+        uv_layer.data.foreach_set("uv", np.asarray(uvs, dtype=np.float32)[loop_indices].ravel())
+   
+    mesh.update(calc_edges=True)
+
+def _bsdf_input(bsdf_node: bpy.types.Node, name: str):
+    """Professional Principled BSDF input lookup by cached socket index (None if absent)"""
+    if not _bsdf_socket_indices:
+        for index, socket in enumerate(bsdf_node.inputs):
+            _bsdf_socket_indices.setdefault(socket.name, index)
+        for old_name, new_name in _BSDF_SOCKET_ALIASES.items():
+            if old_name not in _bsdf_socket_indices and new_name in _bsdf_socket_indices:
+                _bsdf_socket_indices[old_name] = _bsdf_socket_indices[new_name]
+   
+    index = _bsdf_socket_indices.get(name)
+    return None if index is None else bsdf_node.inputs[index]
+
+def _set_bsdf_inputs(bsdf_node: bpy.types.Node, values: dict):
+    """Professional Principled BSDF defaults; inputs this Blender version lacks are skipped"""
+    for name, value in values.items():
+        socket = _bsdf_input(bsdf_node, name)
+        if socket is not None:
+            socket.default_value = value
+
+def _build_quad_strip_mesh(mesh: bpy.types.Mesh, strips):
+    """Professional quad strips between paired (N, 3) vertex rows, all in one mesh.
+   
+    ``strips`` is a sequence of (row_a, row_b, cyclic); cyclic strips (N >= 3) get
+    the closing quad from the last row pair back to the first.
+    """
+    vert_blocks = []
+    quad_blocks = []
+    offset = 0
+    for row_a, row_b, cyclic in strips:
+        count = len(row_a)
+        closed = cyclic and count >= 3
+        verts = np.empty((count * 2, 3), dtype=np.float32)
+        verts[0::2] = row_a
+        verts[1::2] = row_b
+       
+        # Quad i joins a[i], b[i], b[i+1], a[i+1] (i+1 wraps to 0 on the closing quad)
+        base = np.arange(count if closed else count - 1, dtype=np.int32) * 2
+        following = (base + 2) % (count * 2)
+        quads = np.stack((base, base + 1, following + 1, following), axis=-1) + offset
+       
+        vert_blocks.append(verts)
+        quad_blocks.append(quads)
+        offset += count * 2
+   
+    if quad_blocks:
+        _fast_mesh_build(mesh, np.concatenate(vert_blocks), np.concatenate(quad_blocks))
+
+def _cylinder_geometry(radius: float, depth: float, segments: int):
+    """Professional Z-aligned cylinder centred on the origin (n-gon caps)"""
+    theta = np.linspace(0.0, 2 * np.pi, segments, endpoint=False)
+    ring = np.stack((radius * np.cos(theta), radius * np.sin(theta)), axis=-1)
+    verts = np.empty((segments * 2, 3), dtype=np.float32)
+    verts[:segments, :2] = ring
+    verts[:segments, 2] = -depth / 2
+    verts[segments:, :2] = ring
+    verts[segments:, 2] = depth / 2
+   
+    # Professional side quads (bottom i, bottom i+1, top i+1, top i)
+    bottom = np.arange(segments, dtype=np.int32)
+    nxt = np.roll(bottom, -1)
+    sides = np.stack((bottom, nxt, nxt + segments, bottom + segments), axis=-1)
+    caps_top = (bottom + segments)[None, :]
+    caps_bottom = bottom[::-1][None, :]
+   
+    return verts, (sides, caps_top, caps_bottom)
+
+def _uv_sphere_geometry(radius: float, segments: int, ring_count: int):
+    """Professional UV sphere centred on the origin (triangle fans at the poles)"""
+    theta = np.linspace(0.0, 2 * np.pi, segments, endpoint=False)
+    phi = np.linspace(0.0, np.pi, ring_count + 1)[1:-1]
+    rings = np.empty((len(phi), segments, 3), dtype=np.float32)
+    rings[..., 0] = radius * np.sin(phi)[:, None] * np.cos(theta)
+    rings[..., 1] = radius * np.sin(phi)[:, None] * np.sin(theta)
+    rings[..., 2] = radius * np.cos(phi)[:, None]
+    verts = np.concatenate((
+        [(0.0, 0.0, radius)],
+        rings.reshape(-1, 3),
+        [(0.0, 0.0, -radius)]
+    )).astype(np.float32)
+   
+    # Professional ring indices (ring k holds verts 1 + k*segments ...)
+    grid = 1 + np.arange(len(phi) * segments, dtype=np.int32).reshape(len(phi), segments)
+    grid_next = np.roll(grid, -1, axis=1)
+    quads = np.stack((grid[:-1], grid[1:], grid_next[1:], grid_next[:-1]), axis=-1).reshape(-1, 4)
+    south = len(verts) - 1
+    top_fan = np.stack((np.zeros(segments, dtype=np.int32), grid[0], grid_next[0]), axis=-1)
+    bottom_fan = np.stack((np.full(segments, south, dtype=np.int32), grid_next[-1], grid[-1]), axis=-1)
+   
+    return verts, (top_fan, quads, bottom_fan)
+
+def _box_geometry(size_x: float, size_y: float, size_z: float):
+    """Professional axis-aligned box centred on the origin"""
+    corners = np.array([(x, y, z) for x in (-0.5, 0.5) for y in (-0.5, 0.5) for z in (-0.5, 0.5)],
+                       dtype=np.float32)
+    verts = corners * np.array((size_x, size_y, size_z), dtype=np.float32)
+    faces = np.array([
+        (0, 1, 3, 2), (4, 6, 7, 5),  # -X, +X
+        (0, 4, 5, 1), (2, 3, 7, 6),  # -Y, +Y
+        (0, 2, 6, 4), (1, 5, 7, 3)   # -Z, +Z
+    ], dtype=np.int32)
+   
+    return verts, faces
+
+def _bowl_geometry(radius: float, depth: float, segments: int, rings: int):
+    """Professional paraboloid bowl: z = -depth * (1 - (r / radius)^2), rim at z = 0"""
+    theta = np.linspace(0.0, 2 * np.pi, segments, endpoint=False)
+    ring_radii = radius * np.arange(1, rings + 1) / rings
+    verts = np.zeros((1 + rings * segments, 3), dtype=np.float32)
+    ring_verts = verts[1:].reshape(rings, segments, 3)
+    ring_verts[..., 0] = ring_radii[:, None] * np.cos(theta)
+    ring_verts[..., 1] = ring_radii[:, None] * np.sin(theta)
+    ring_verts[..., 2] = -depth * (1 - (ring_radii[:, None] / radius) ** 2)
+    verts[0, 2] = -depth
+   
+    # Professional centre fan plus quads between neighbouring rings (normals face up)
+    grid = 1 + np.arange(rings * segments, dtype=np.int32).reshape(rings, segments)
+    grid_next = np.roll(grid, -1, axis=1)
+    fan = np.stack((np.zeros(segments, dtype=np.int32), grid[0], grid_next[0]), axis=-1)
+    quads = np.stack((grid[:-1], grid[1:], grid_next[1:], grid_next[:-1]), axis=-1).reshape(-1, 4)
+   
+    return verts, (fan, quads)
+
+def _ocean_wave_heights(x_axis: np.ndarray, y_axis: np.ndarray, wave_height: float, wave_scale: float,
+                        octaves: int = 4) -> np.ndarray:
+    """Professional fractal sine wave field in [-wave_height/2, wave_height/2] over a regular grid"""
+    heights = np.empty((len(y_axis), len(x_axis)), dtype=np.float32)
+    if HAS_NUMBA:
+        _ocean_wave_kernel(x_axis, y_axis, wave_height, wave_scale, octaves, heights)
+        return heights
+   
+    xs = x_axis[None, :]
+    ys = y_axis[:, None]
+    heights.fill(0.0)
+    amplitude = 1.0
+    frequency = 2 * np.pi / wave_scale
+    total_amplitude = 0.0
+   
+    for octave in range(octaves):
+        # Rotate each octave by the golden angle so the crests never line up
+        angle = octave * 2.399963
+        u = xs * np.cos(angle) + ys * np.sin(angle)
+        v = ys * np.cos(angle) - xs * np.sin(angle)
+        heights += amplitude * np.sin(u * frequency + octave) * np.cos(v * frequency * 0.7 + octave * 1.3)
+        total_amplitude += amplitude
+        amplitude *= 0.5
+        frequency *= 2.0
+   
+    heights *= wave_height / (2 * total_amplitude)
+    return heights
+
+def _fast_object(name: str, verts: np.ndarray, faces, location=(0.0, 0.0, 0.0),
+                 uvs: np.ndarray = None) -> bpy.types.Object:
+    """Professional object creation from numpy geometry, linked to the active collection"""
+    mesh = bpy.data.meshes.new(name)
+    _fast_mesh_build(mesh, verts, faces, uvs)
+   
+    obj = bpy.data.objects.new(name, mesh)
+    obj.location = location
+    bpy.context.collection.objects.link(obj)
+   
+    return obj
+
+def _fast_cylinder(name: str, detail: int, radius: float, depth: float, location=(0.0, 0.0, 0.0)) -> bpy.types.Object:
+    """Professional operator-free replacement for primitive_cylinder_add"""
+    verts, faces = _cylinder_geometry(radius, depth, detail)
+    return _fast_object(name, verts, faces, location)
+
+def _fast_plane(name: str, size: float, location=(0.0, 0.0, 0.0)) -> bpy.types.Object:
+    """Professional operator-free replacement for primitive_plane_add"""
+    half = size / 2
+    verts = np.array([(-half, -half, 0.0), (half, -half, 0.0), (half, half, 0.0), (-half, half, 0.0)],
+                     dtype=np.float32)
+    uvs = np.array([(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)], dtype=np.float32)
+    return _fast_object(name, verts, np.array([(0, 1, 2, 3)], dtype=np.int32), location, uvs=uvs)
+
+if HAS_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _height_stats(values):
+        """Professional fused min/max/mean reduction in one pass over memory"""
+        min_height = values[0]
+        max_height = values[0]
+        total = 0.0
+        for i in prange(values.size):
+            value = values[i]
+            min_height = min(min_height, value)
+            max_height = max(max_height, value)
+            total += value
+        return min_height, max_height, total / values.size
+   
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _luminance_kernel(pixels, height_scale, out):
+        """Professional row-parallel luminance (height scale folded in) fused with min/max/mean"""
+        min_height = np.inf
+        max_height = -np.inf
+        total = 0.0
+        for row in prange(pixels.shape[0]):
+            for col in range(pixels.shape[1]):
+                height = (pixels[row, col, 0] * 0.299
+                          + pixels[row, col, 1] * 0.587
+                          + pixels[row, col, 2] * 0.114) * height_scale
+                out[row, col] = height
+                min_height = min(min_height, height)
+                max_height = max(max_height, height)
+                total += height
+        return min_height, max_height, total / out.size
+   
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _ocean_wave_kernel(x_axis, y_axis, wave_height, wave_scale, octaves, out):
+        """Professional row-parallel version of the _ocean_wave_heights fractal"""
+        cos_angle = np.empty(octaves)
+        sin_angle = np.empty(octaves)
+        amplitude = np.empty(octaves)
+        frequency = np.empty(octaves)
+        for octave in range(octaves):
+            cos_angle[octave] = np.cos(octave * 2.399963)
+            sin_angle[octave] = np.sin(octave * 2.399963)
+            amplitude[octave] = 0.5 ** octave
+            frequency[octave] = 2 * np.pi / wave_scale * 2.0 ** octave
+        scale = wave_height / (2 * amplitude.sum())
+       
+        for row in prange(out.shape[0]):
+            y = y_axis[row]
+            for col in range(out.shape[1]):
+                x = x_axis[col]
+                height = 0.0
+                for octave in range(octaves):
+                    u = x * cos_angle[octave] + y * sin_angle[octave]
+                    v = y * cos_angle[octave] - x * sin_angle[octave]
+                    height += (amplitude[octave] * np.sin(u * frequency[octave] + octave)
+                               * np.cos(v * frequency[octave] * 0.7 + octave * 1.3))
+                out[row, col] = height * scale
 
 # Property Group for Scene Properties
 class RAGE_Studio_Properties(PropertyGroup):
@@ -21,9 +325,9 @@ class RAGE_OT_ImportHeightmap(Operator, ImportHelper):
     bl_label = "Import Heightmap"
     bl_description = "Import heightmap image for professional terrain generation"
    
-    filename_ext = ".png;.jpg;.tiff;.tga;.bmp"
+    filename_ext = ".png;.jpg;.tiff;.tga;.bmp;.raw;.r16"
     filter_glob: StringProperty(
-        default="*.png;*.jpg;*.jpeg;*.tiff;*.tif;*.tga;*.bmp",
+        default="*.png;*.jpg;*.jpeg;*.tiff;*.tif;*.tga;*.bmp;*.raw;*.r16",
         options={'HIDDEN'}
     )
    
@@ -110,144 +414,203 @@ class RAGE_OT_ImportHeightmap(Operator, ImportHelper):
    
     def _create_terrain_from_heightmap(self, image_path: str, resolution: int, height_scale: float) -> dict:
         """Professional heightmap processing with industry-standard techniques"""
-        image = None
         try:
-            # Professional image loading
-            image = bpy.data.images.load(image_path)
-            image.colorspace_settings.name = 'Non-Color'  # Professional color management
-           
-            # Professional resolution handling
-            if image.size[0] != resolution or image.size[1] != resolution:
+            # Professional direct decoding (bypasses Blender's image datablock when possible)
+            pixels = self._read_heightmap_file(image_path)
+            if pixels is not None and (pixels.shape[0] != resolution or pixels.shape[1] != resolution):
                 print(f"🔄 Scaling image to {resolution}x{resolution}")
-                image.scale(resolution, resolution)
-           
-            # Professional pixel processing
-            pixels = np.array(image.pixels[:])
-            pixels = pixels.reshape((resolution, resolution, 4))
-           
-            # Professional height extraction (industry-standard luminance weights)
-            height_data = np.dot(pixels[..., :3], [0.299, 0.587, 0.114])
-           
-            # Professional height scaling
-            height_data = height_data * height_scale
+                pixels = self._resize_heightmap(pixels, resolution)
+           
+            # Blender's scaler handles files (and resizes) the direct path cannot
+            if pixels is None:
+                pixels = self._read_heightmap_blender(image_path, resolution)
+           
+            # Integer samples stay integer until the single float conversion below
+            is_integer = np.issubdtype(pixels.dtype, np.integer)
+            sample_scale = np.float32(height_scale / (np.iinfo(pixels.dtype).max if is_integer else 1.0))
+           
+            # Professional height buffer, written in place by every extraction path below
+            height_data = np.empty(pixels.shape[:2], dtype=np.float32)
+           
+            # Professional height extraction (industry-standard luminance weights) and scaling
+            height_stats = None
+            if pixels.ndim == 2:
+                np.multiply(pixels, sample_scale, out=height_data)
+            elif pixels.shape[2] >= 3 and HAS_NUMBA:
+                height_stats = _luminance_kernel(pixels, sample_scale, height_data)
+            elif pixels.shape[2] >= 3 and is_integer:
+                # Professional fixed-point luminance (77/150/29 >> 8 ~ 0.299/0.587/0.114)
+                acc = np.uint16 if pixels.dtype.itemsize == 1 else np.uint32
+                luminance = pixels[..., 0].astype(acc) * acc(77)
+                luminance += pixels[..., 1].astype(acc) * acc(150)
+                luminance += pixels[..., 2].astype(acc) * acc(29)
+                luminance += acc(128)  # Round to nearest instead of truncating
+                luminance >>= 8
+                np.multiply(luminance, sample_scale, out=height_data)
+            elif pixels.shape[2] >= 3:
+                # Professional single float32 pass (scale folded into the weights, RGB read as a strided view);
+                # float64 sources are narrowed in the same pass
+                np.einsum('ijk,k->ij', pixels[..., :3], LUMINANCE_WEIGHTS * sample_scale,
+                          out=height_data, dtype=np.float32, casting='same_kind', optimize=True)
+            else:
+                np.multiply(pixels[..., 0], sample_scale, out=height_data)  # Grayscale + alpha
            
             return {
                 'height_data': height_data,
                 'resolution': resolution,
                 'height_scale': height_scale,
-                'bounds': self._calculate_terrain_bounds(height_data, height_scale)
+                'bounds': self._calculate_terrain_bounds(height_data, height_scale, height_stats)
             }
            
         except Exception as e:
             raise Exception(f"❌ Professional heightmap processing failed: {str(e)}")
+   
+    def _read_heightmap_file(self, image_path: str):
+        """Professional direct heightmap decoding in the file's native sample type.
+       
+        Returns None when no direct decoder is available for (or can decode) the file.
+        """
+        pixels = None
+        if os.path.splitext(image_path)[1].lower() in RAW_HEIGHTMAP_EXTENSIONS:
+            # Professional raw heightmap mapping (no copy until the float conversion)
+            file_size = os.path.getsize(image_path)
+            side = int(np.sqrt(file_size // 2))
+            if side == 0 or side * side * 2 != file_size:
+                raise ValueError(f"Raw heightmap must be a square grid of 16-bit samples "
+                                 f"({file_size} bytes is not side x side x 2)")
+            pixels = np.memmap(image_path, dtype='<u2', mode='r', shape=(side, side))
+        elif HAS_CV2:
+            # Professional SIMD decode in native depth (cv2.imread returns None on unsupported files)
+            pixels = cv2.imread(image_path, cv2.IMREAD_UNCHANGED)
+            if pixels is not None and pixels.ndim == 3 and pixels.shape[2] >= 3:
+                # OpenCV decodes colour as BGR(A); the luminance weights expect RGB(A)
+                code = cv2.COLOR_BGR2RGB if pixels.shape[2] == 3 else cv2.COLOR_BGRA2RGBA
+                pixels = cv2.cvtColor(pixels, code)
+       
+        if pixels is None and HAS_IMAGEIO:
+            try:
+                pixels = iio.imread(image_path)
+            except Exception as e:
+                print(f"⚠️ imageio could not decode heightmap, using Blender's loader: {e}")
+                return None
+        if pixels is None:
+            return None
+       
+        # Image files store the top row first, Blender stores the bottom row first
+        return pixels[::-1]
+   
+    def _read_heightmap_blender(self, image_path: str, resolution: int) -> np.ndarray:
+        """Fallback heightmap decoding through Blender's image system"""
+        image = None
+        try:
+            # Professional image loading
+            image = bpy.data.images.load(image_path)
+            image.colorspace_settings.name = 'Non-Color'  # Professional color management
+           
+            # Professional resolution handling
+            if image.size[0] != resolution or image.size[1] != resolution:
+                print(f"🔄 Scaling image to {resolution}x{resolution}")
+                image.scale(resolution, resolution)
+           
+            # Professional pixel processing (bulk copy straight into a float32 buffer)
+            pixels = np.empty(len(image.pixels), dtype=np.float32)
+            image.pixels.foreach_get(pixels)
+            return pixels.reshape((resolution, resolution, 4))
         finally:
             # Professional cleanup
             if image and image.name in bpy.data.images:
                 bpy.data.images.remove(image)
    
-    def _calculate_terrain_bounds(self, height_data: np.ndarray, height_scale: float) -> dict:
-        """Professional terrain bounds calculation"""
-        min_height = np.min(height_data)
-        max_height = np.max(height_data)
+    def _resize_heightmap(self, pixels: np.ndarray, resolution: int):
+        """Professional heightmap resampling to the target resolution.
+       
+        Returns None when no area filter applies, so the caller falls back to Blender's scaler.
+        """
+        if HAS_CV2:
+            # Area interpolation is the correct filter for downsampling height data
+            return cv2.resize(np.ascontiguousarray(pixels), (resolution, resolution),
+                              interpolation=cv2.INTER_AREA)
+       
+        # Without OpenCV only square integer-factor downscales can be box-filtered in NumPy
+        factor = pixels.shape[0] // resolution
+        if factor < 1 or pixels.shape[0] != pixels.shape[1] or pixels.shape[0] != factor * resolution:
+            return None
+       
+        if pixels.ndim == 2:
+            averaged = block_average(pixels, factor)
+        else:
+            averaged = np.stack([block_average(pixels[..., channel], factor)
+                                 for channel in range(pixels.shape[2])], axis=-1)
+       
+        # Back to the source sample type so the integer height scaling still applies
+        if np.issubdtype(pixels.dtype, np.integer):
+            np.rint(averaged, out=averaged)
+        return averaged.astype(pixels.dtype, copy=False)
+   
+    def _calculate_terrain_bounds(self, height_data: np.ndarray, height_scale: float, height_stats=None) -> dict:
+        """Professional terrain bounds calculation (single pass when Numba is available).
+       
+        ``height_stats`` is a precomputed (min, max, mean) from a fused kernel.
+        """
+        flat = height_data.ravel()
+        if height_stats is not None:
+            min_height, max_height, average_height = height_stats
+        elif HAS_NUMBA:
+            min_height, max_height, average_height = _height_stats(flat)
+        else:
+            min_height, max_height, average_height = flat.min(), flat.max(), flat.mean()
        
         return {
-            'min_height': float(min_height),
-            'max_height': float(max_height),
-            'height_range': float(max_height - min_height),
-            'average_height': float(np.mean(height_data))
+            'min_height': min_height,
+            'max_height': max_height,
+            'height_range': max_height - min_height,
+            'average_height': average_height
         }
    
     def _build_terrain_mesh(self, mesh: bpy.types.Mesh, terrain_data: dict):
         """Professional terrain mesh construction"""
-        height_data = terrain_data['height_data']
         resolution = terrain_data['resolution']
+        height_data = terrain_data['height_data'][:resolution, :resolution]
        
-        bm = bmesh.new()
-       
-        try:
-            # Professional vertex grid creation
-            verts = []
-            for y in range(resolution):
-                for x in range(resolution):
-                    height = height_data[y, x]
-                    # Professional centering
-                    x_pos = (x - resolution/2)
-                    y_pos = (y - resolution/2)
-                    vert = (x_pos, y_pos, height)
-                    verts.append(bm.verts.new(vert))
-           
-            bm.verts.ensure_lookup_table()
-           
-            # Professional quad face creation
-            for y in range(resolution - 1):
-                for x in range(resolution - 1):
-                    v1 = verts[y * resolution + x]
-                    v2 = verts[y * resolution + x + 1]
-                    v3 = verts[(y + 1) * resolution + x + 1]
-                    v4 = verts[(y + 1) * resolution + x]
-                   
-                    # Professional face creation with error handling
-                    try:
-                        bm.faces.new((v1, v2, v3, v4))
-                    except ValueError:
-                        pass  # Professional duplicate face handling
-           
-            # Professional normal calculation
-            bm.normal_update()
-           
-            # Professional UV mapping
-            uv_layer = bm.loops.layers.uv.new()
-            for face in bm.faces:
-                for loop in face.loops:
-                    vert = loop.vert
-                    uv_x = (vert.co.x + resolution/2) / resolution
-                    uv_y = (vert.co.y + resolution/2) / resolution
-                    loop[uv_layer].uv = (uv_x, uv_y)
-           
-            # Professional mesh finalization
-            bm.to_mesh(mesh)
-            mesh.update()
-           
-        finally:
-            bm.free()
+        # Professional centred grid arrays (shared with the LOD worker, one sample per pixel)
+        verts, faces, uvs = grid_mesh_arrays(height_data, resolution, 1)
+        _fast_mesh_build(mesh, verts, faces, uvs)
    
     def _create_terrain_material(self, obj: bpy.types.Object, heightmap_path: str):
         """Professional PBR terrain material creation"""
-        try:
-            mat = bpy.data.materials.new(name="RDR_Terrain_Material_Professional")
-            mat.use_nodes = True
-            nodes = mat.node_tree.nodes
-            links = mat.node_tree.links
-           
-            # Professional node cleanup
-            nodes.clear()
-           
-            # Professional PBR node setup
-            output_node = nodes.new(type='ShaderNodeOutputMaterial')
-            bsdf_node = nodes.new(type='ShaderNodeBsdfPrincipled')
-           
-            # Professional node positioning
-            output_node.location = (400, 0)
-            bsdf_node.location = (0, 0)
-           
-            # Professional node connections
-            links.new(bsdf_node.outputs['BSDF'], output_node.inputs['Surface'])
-           
-            # Professional terrain material properties
-            bsdf_node.inputs['Roughness'].default_value = 0.8
-            bsdf_node.inputs['Specular'].default_value = 0.2
-            bsdf_node.inputs['Base Color'].default_value = (0.3, 0.25, 0.2, 1.0)  # Professional terrain color
-           
-            # Professional material assignment
-            if obj.data.materials:
-                obj.data.materials[0] = mat
-            else:
-                obj.data.materials.append(mat)
-           
-            print("✅ Professional terrain material created")
-               
-        except Exception as e:
-            print(f"⚠️ Terrain material creation failed: {e}")
+        mat = bpy.data.materials.new(name="RDR_Terrain_Material_Professional")
+        mat.use_nodes = True
+        nodes = mat.node_tree.nodes
+        links = mat.node_tree.links
+       
+        # Professional node cleanup
+        nodes.clear()
+       
+        # Professional PBR node setup
+        output_node = nodes.new(type='ShaderNodeOutputMaterial')
+        bsdf_node = nodes.new(type='ShaderNodeBsdfPrincipled')
+       
+        # Professional node positioning
+        output_node.location = (400, 0)
+        bsdf_node.location = (0, 0)
+       
+        # Professional node connections
+        links.new(bsdf_node.outputs['BSDF'], output_node.inputs['Surface'])
+       
+        # Professional terrain material properties
+        _set_bsdf_inputs(bsdf_node, {
+            'Roughness': 0.8,
+            'Specular': 0.2,
+            'Base Color': (0.3, 0.25, 0.2, 1.0)  # Professional terrain color
+        })
+       
+        # Professional material assignment
+        if obj.data.materials:
+            obj.data.materials[0] = mat
+        else:
+            obj.data.materials.append(mat)
+       
+        print("✅ Professional terrain material created")
    
     def _generate_terrain_collision(self, obj: bpy.types.Object, terrain_data: dict):
         """Professional terrain collision mesh generation"""
@@ -284,10 +647,10 @@ class RAGE_OT_ImportHeightmap(Operator, ImportHelper):
         """Professional terrain simplification using industry algorithms"""
         height_data = terrain_data['height_data']
        
-        # Professional downsampling
+        # Professional block-average downsampling: one row-major pass instead of strided picks
         if height_data.shape[0] > new_resolution:
             step = height_data.shape[0] // new_resolution
-            simplified_height = height_data[::step, ::step]
+            simplified_height = block_average(height_data, step)
         else:
             simplified_height = height_data
        
@@ -321,24 +684,22 @@ class RAGE_OT_CreateTerrainGrid(Operator):
    
     def execute(self, context):
         try:
-            # Professional grid creation
-            bpy.ops.mesh.primitive_grid_add(
-                x_subdivisions=self.resolution,
-                y_subdivisions=self.resolution,
-                size=self.size,
-                location=(0, 0, 0)
-            )
+            # Professional grid creation (resolution x resolution quads, flat, centred, 0-1 UVs)
+            flat_height = np.zeros((self.resolution + 1, self.resolution + 1), dtype=np.float32)
+            verts, faces, uvs = grid_mesh_arrays(flat_height, self.resolution, 1)
+            verts[:, :2] *= self.size / self.resolution
            
-            obj = context.active_object
-            obj.name = "RDR_Terrain_Grid_Professional"
+            obj = _fast_object("RDR_Terrain_Grid_Professional", verts, faces, uvs=uvs)
+            context.view_layer.objects.active = obj
+            obj.select_set(True)
            
             # Professional property setup
             obj["rage_terrain"] = True
             obj["terrain_resolution"] = self.resolution
             obj["grid_size"] = self.size
            
-            # Professional shading
-            bpy.ops.object.shade_smooth()
+            # Professional shading (one bulk write instead of the shade_smooth operator)
+            obj.data.polygons.foreach_set("use_smooth", np.ones(len(obj.data.polygons), dtype=bool))
            
             # Professional scene management
             context.scene.rage_studio.terrain_object = obj.name
@@ -376,7 +737,10 @@ class RAGE_OT_GenerateTerrainLODs(Operator):
             # Professional LOD generation
             lods_created = self._generate_terrain_lods(terrain_obj, self.lod_levels)
            
-            self.report({'INFO'}, f"✅ Generated {lods_created} professional LOD levels")
+            if lods_created < self.lod_levels:
+                self.report({'WARNING'}, f"⚠️ Generated {lods_created} of {self.lod_levels} LOD levels (see console)")
+            else:
+                self.report({'INFO'}, f"✅ Generated {lods_created} professional LOD levels")
            
         except Exception as e:
             self.report({'ERROR'}, f"❌ LOD generation failed: {str(e)}")
@@ -386,35 +750,110 @@ class RAGE_OT_GenerateTerrainLODs(Operator):
    
     def _generate_terrain_lods(self, terrain_obj: bpy.types.Object, lod_levels: int) -> int:
         """Professional LOD generation using industry algorithms"""
-        created_count = 0
+        lod_objects = []
+       
+        # Professional grid LODs built from the height field in worker processes
+        lod_arrays = self._build_grid_lod_arrays(terrain_obj, lod_levels)
+        levels = sorted(lod_arrays) if lod_arrays is not None else range(1, lod_levels + 1)
        
-        for i in range(1, lod_levels + 1):
+        # Grid levels coarser than 2 x 2 samples have no quads left to build
+        skipped_levels = [i for i in range(1, lod_levels + 1) if i not in levels]
+        if skipped_levels:
+            print(f"⚠️ Skipped LOD levels {skipped_levels}: terrain grid is too coarse to halve further")
+       
+        for i in levels:
+            lod_mesh = lod_obj = None
             try:
                 # Professional LOD mesh creation
-                lod_mesh = terrain_obj.data.copy()
+                if lod_arrays is not None:
+                    verts, faces, uvs = lod_arrays[i]
+                    lod_mesh = bpy.data.meshes.new(f"{terrain_obj.name}_LOD{i}_Professional")
+                    _fast_mesh_build(lod_mesh, verts, faces, uvs)
+                    for material in terrain_obj.data.materials:
+                        lod_mesh.materials.append(material)
+                else:
+                    lod_mesh = terrain_obj.data.copy()
                 lod_obj = bpy.data.objects.new(f"{terrain_obj.name}_LOD{i}_Professional", lod_mesh)
                
-                # Professional scene linking
-                bpy.context.collection.objects.link(lod_obj)
-               
-                # Professional simplification (industry standard decimation)
-                lod_obj.modifiers.new(name=f"Decimate_LOD{i}", type='DECIMATE')
-                lod_obj.modifiers[f"Decimate_LOD{i}"].ratio = 1.0 / (2 ** i)
+                # Professional simplification (industry standard decimation) for non-grid terrain
+                if lod_arrays is None:
+                    decimate_mod = lod_obj.modifiers.new(name=f"Decimate_LOD{i}", type='DECIMATE')
+                    decimate_mod.decimate_type = 'COLLAPSE'
+                    decimate_mod.ratio = 1.0 / (2 ** i)
                
                 # Professional LOD properties
                 lod_obj["rage_lod_level"] = i
                 lod_obj["rage_terrain"] = True
                 lod_obj.parent = terrain_obj
                
-                created_count += 1
+                lod_objects.append(lod_obj)
                
                 print(f"✅ Created professional LOD {i}")
                
             except Exception as e:
                 print(f"⚠️ Failed to create LOD {i}: {e}")
+               
+                # Professional cleanup so a failed level leaves no orphan datablocks
+                if lod_obj is not None:
+                    bpy.data.objects.remove(lod_obj)
+                if lod_mesh is not None:
+                    bpy.data.meshes.remove(lod_mesh)
                 continue
        
-        return created_count
+        # Professional scene linking in one pass once every LOD is fully set up
+        collection_objects = bpy.context.collection.objects
+        for lod_obj in lod_objects:
+            collection_objects.link(lod_obj)
+       
+        return len(lod_objects)
+   
+    def _build_grid_lod_arrays(self, terrain_obj: bpy.types.Object, lod_levels: int):
+        """Professional parallel LOD array generation for heightmap grid terrain.
+       
+        Returns {level: (verts, faces, uvs)} or None when the terrain is not a
+        regular heightmap grid.
+        """
+        mesh = terrain_obj.data
+        resolution = terrain_obj.get("terrain_resolution", 0)
+        if not terrain_obj.get("heightmap_source") or len(mesh.vertices) != resolution * resolution:
+            return None
+       
+        # Professional height extraction (z of the row-major vertex grid)
+        coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", coords)
+        height_data = np.ascontiguousarray(coords[2::3].reshape(resolution, resolution))
+        levels = [i for i in range(1, lod_levels + 1) if resolution >> i >= 2]
+       
+        max_workers = max(1, min(len(levels), os.cpu_count() or 1))
+       
+        # Professional in-process resampling for small grids (sub-second, no worker startup);
+        # NumPy releases the GIL, so the levels still build on parallel threads
+        if resolution < LOD_WORKER_MIN_RESOLUTION:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return dict(zip(levels, executor.map(
+                    lambda level: grid_mesh_arrays(height_data, resolution, 2 ** level), levels)))
+       
+        with tempfile.TemporaryDirectory(prefix="rage_lod_") as temp_dir:
+            height_path = os.path.join(temp_dir, "height_data.npy")
+            np.save(height_path, height_data)
+           
+            def build_level(level: int):
+                output_path = os.path.join(temp_dir, f"lod{level}.npz")
+                try:
+                    subprocess.run(
+                        [sys.executable, LOD_WORKER_SCRIPT, height_path,
+                         str(resolution), str(2 ** level), output_path],
+                        check=True, capture_output=True, timeout=600
+                    )
+                    with np.load(output_path) as result:
+                        return level, (result['verts'], result['faces'], result['uvs'])
+                except (OSError, subprocess.SubprocessError) as e:
+                    print(f"⚠️ LOD worker failed for level {level}, building in-process: {e}")
+                    return level, grid_mesh_arrays(height_data, resolution, 2 ** level)
+           
+            # Professional process-level parallelism (one worker per LOD level)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return dict(executor.map(build_level, levels))
 
 class RAGE_OT_BoreTunnel(Operator):
     bl_idname = "rage.bore_tunnel"
@@ -517,107 +956,137 @@ class RAGE_OT_BoreTunnel(Operator):
    
     def _create_through_tunnel(self, path_obj, radius: float, length: float, segments: int):
         """Professional through tunnel creation"""
-        # Store current context
-        original_active = bpy.context.view_layer.objects.active
-        original_selected = bpy.context.selected_objects.copy()
+        # Create professional cylinder for tunnel
+        tunnel_obj = _fast_cylinder("RDR_Tunnel_Professional", segments, radius, length, path_obj.location)
+        tunnel_obj["rage_tunnel"] = True
        
-        try:
-            # Create professional cylinder for tunnel
-            bpy.ops.mesh.primitive_cylinder_add(
-                vertices=segments,
-                radius=radius,
-                depth=length,
-                location=path_obj.location
-            )
-           
-            tunnel_obj = bpy.context.active_object
-            tunnel_obj.name = "RDR_Tunnel_Professional"
-            tunnel_obj["rage_tunnel"] = True
-           
-            return {
-                'object': tunnel_obj,
-                'type': 'TUNNEL',
-                'radius': radius,
-                'length': length
-            }
-        finally:
-            # Restore context
-            bpy.context.view_layer.objects.active = original_active
-            for obj in original_selected:
-                obj.select_set(True)
+        return {
+            'object': tunnel_obj,
+            'type': 'TUNNEL',
+            'radius': radius,
+            'length': length
+        }
    
     def _create_enclosed_cave(self, path_obj, radius: float, segments: int):
         """Professional enclosed cave creation"""
-        original_active = bpy.context.view_layer.objects.active
-        original_selected = bpy.context.selected_objects.copy()
+        # Create professional sphere for cave
+        verts, faces = _uv_sphere_geometry(radius, segments, segments // 2)
+        cave_obj = _fast_object("RDR_Cave_Professional", verts, faces, path_obj.location)
+        cave_obj["rage_cave"] = True
        
-        try:
-            # Create professional sphere for cave
-            bpy.ops.mesh.primitive_uv_sphere_add(
-                segments=segments,
-                ring_count=segments//2,
-                radius=radius,
-                location=path_obj.location
-            )
-           
-            cave_obj = bpy.context.active_object
-            cave_obj.name = "RDR_Cave_Professional"
-            cave_obj["rage_cave"] = True
-           
-            return {
-                'object': cave_obj,
-                'type': 'CAVE',
-                'radius': radius
-            }
-        finally:
-            bpy.context.view_layer.objects.active = original_active
-            for obj in original_selected:
-                obj.select_set(True)
+        return {
+            'object': cave_obj,
+            'type': 'CAVE',
+            'radius': radius
+        }
    
     def _create_excavation(self, path_obj, radius: float, length: float):
         """Professional excavation creation"""
-        original_active = bpy.context.view_layer.objects.active
-        original_selected = bpy.context.selected_objects.copy()
+        # Create professional box for excavation (built at final dimensions)
+        verts, faces = _box_geometry(radius * 2, radius * 2, length)
+        excav_obj = _fast_object("RDR_Excavation_Professional", verts, faces, path_obj.location)
+        excav_obj["rage_excavation"] = True
        
-        try:
-            # Create professional cube for excavation
-            bpy.ops.mesh.primitive_cube_add(
-                size=radius * 2,
-                location=path_obj.location
-            )
-           
-            excav_obj = bpy.context.active_object
-            excav_obj.name = "RDR_Excavation_Professional"
-            excav_obj.dimensions = (radius * 2, radius * 2, length)
-            excav_obj["rage_excavation"] = True
-           
-            return {
-                'object': excav_obj,
-                'type': 'EXCAVATION',
-                'radius': radius,
-                'length': length
-            }
-        finally:
-            bpy.context.view_layer.objects.active = original_active
-            for obj in original_selected:
-                obj.select_set(True)
+        return {
+            'object': excav_obj,
+            'type': 'EXCAVATION',
+            'radius': radius,
+            'length': length
+        }
    
     def _apply_tunnel_to_terrain(self, terrain_obj, tunnel_data):
-        """Professional terrain modification using Boolean operations"""
+        """Professional terrain modification (heightmap carve, Boolean fallback)"""
         tunnel_obj = tunnel_data['object']
        
-        # Professional Boolean modifier setup
-        bool_mod = terrain_obj.modifiers.new(name="Tunnel_Boolean", type='BOOLEAN')
-        bool_mod.operation = 'DIFFERENCE'
-        bool_mod.object = tunnel_obj
-       
-        # Professional application
-        bpy.context.view_layer.objects.active = terrain_obj
-        bpy.ops.object.modifier_apply(modifier=bool_mod.name)
+        # Professional heightmap-domain carve for imported heightmap grids
+        if not self._carve_heightmap_terrain(terrain_obj, tunnel_data):
+            # Professional Boolean modifier setup
+            bool_mod = terrain_obj.modifiers.new(name="Tunnel_Boolean", type='BOOLEAN')
+            bool_mod.operation = 'DIFFERENCE'
+            bool_mod.object = tunnel_obj
+           
+            if len(terrain_obj.modifiers) == 1:
+                # Professional evaluated-mesh bake (no operator, undo push or active-object switch)
+                depsgraph = bpy.context.evaluated_depsgraph_get()
+                # Keep UV maps, vertex groups and attributes exactly as modifier_apply would
+                carved_mesh = bpy.data.meshes.new_from_object(
+                    terrain_obj.evaluated_get(depsgraph),
+                    preserve_all_data_layers=True,
+                    depsgraph=depsgraph
+                )
+                original_mesh = terrain_obj.data
+                terrain_obj.modifiers.remove(bool_mod)
+                terrain_obj.data = carved_mesh
+               
+                mesh_name = original_mesh.name
+                if original_mesh.users == 0:
+                    bpy.data.meshes.remove(original_mesh)
+                carved_mesh.name = mesh_name
+            else:
+                # Professional application on top of an existing modifier stack
+                bpy.context.view_layer.objects.active = terrain_obj
+                bpy.ops.object.modifier_apply(modifier=bool_mod.name)
        
         # Professional cleanup
         bpy.data.objects.remove(tunnel_obj)
    
+    def _carve_heightmap_terrain(self, terrain_obj, tunnel_data) -> bool:
+        """Professional carve of z = min(z, tool floor) over the tool footprint.
+       
+        Returns False when the terrain is not a heightmap grid or the tool is
+        fully buried (an enclosed void needs real CSG).
+        """
+        mesh = terrain_obj.data
+        resolution = terrain_obj.get("terrain_resolution", 0)
+        if not terrain_obj.get("heightmap_source") or len(mesh.vertices) != resolution * resolution:
+            return False
+       
+        # Professional tool placement in terrain space (vertex (col, row) sits at col - res/2, row - res/2)
+        center = terrain_obj.matrix_world.inverted() @ tunnel_data['object'].location
+        scale_x, scale_y, scale_z = terrain_obj.matrix_world.to_scale()
+        radius = tunnel_data['radius']
+        half_length = tunnel_data.get('length', 2 * radius) / 2
+       
+        # Professional sub-window covering only the tool footprint
+        col_start = max(int(np.floor(center.x - radius / scale_x + resolution / 2)), 0)
+        col_end = min(int(np.ceil(center.x + radius / scale_x + resolution / 2)) + 1, resolution)
+        row_start = max(int(np.floor(center.y - radius / scale_y + resolution / 2)), 0)
+        row_end = min(int(np.ceil(center.y + radius / scale_y + resolution / 2)) + 1, resolution)
+        if col_start >= col_end or row_start >= row_end:
+            return True  # Footprint misses the terrain entirely
+       
+        coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", coords)
+        window = coords.reshape(resolution, resolution, 3)[row_start:row_end, col_start:col_end, 2]
+       
+        # Professional footprint distances in world units
+        dx = (np.arange(col_start, col_end) - resolution / 2 - center.x) * scale_x
+        dy = (np.arange(row_start, row_end) - resolution / 2 - center.y)[:, None] * scale_y
+       
+        if tunnel_data['type'] == 'EXCAVATION':
+            inside = (np.abs(dx) < radius) & (np.abs(dy) < radius)
+            extent = np.full(inside.shape, half_length)
+        else:
+            dist_sq = dx ** 2 + dy ** 2
+            inside = dist_sq < radius ** 2
+            if tunnel_data['type'] == 'CAVE':
+                extent = np.sqrt(np.maximum(radius ** 2 - dist_sq, 0.0))
+            else:
+                extent = np.full(inside.shape, half_length)
+       
+        floor = center.z - extent / scale_z
+        breach = inside & (center.z + extent / scale_z >= window)
+        if not breach.any():
+            return False
+       
+        # Professional carve and single bulk write-back
+        np.minimum(window, floor, out=window, where=breach)
+        mesh.vertices.foreach_set("co", coords)
+        mesh.update()
+       
+        print(f"✅ Heightmap carve: {int(breach.sum())} vertices lowered")
+        return True
+   
     def _create_tunnel_collision(self, tunnel_data):
         """Professional tunnel collision generation"""
         # Professional collision mesh creation would go here
@@ -658,6 +1127,12 @@ class RAGE_OT_GenerateRiver(Operator):
         default=True
     )
    
+    unique_material: BoolProperty(
+        name="Unique Material",
+        description="Give this river its own copy of the shared water material for per-river tweaks",
+        default=False
+    )
+   
     def execute(self, context):
         if not context.active_object or context.active_object.type != 'CURVE':
             self.report({'ERROR'}, "❌ Select a professional curve object for river path")
@@ -683,11 +1158,14 @@ class RAGE_OT_GenerateRiver(Operator):
    
     def _create_river_system(self, curve_obj, width: float, depth: float):
         """Professional river system creation"""
+        # Professional single curve sampling shared by the bed and the banks
+        paths = self._sample_curve_paths(curve_obj)
+       
         # Professional river bed creation
-        river_bed = self._create_river_bed(curve_obj, width, depth)
+        river_bed = self._create_river_bed(curve_obj, paths, width, depth)
        
         # Professional river banks creation
-        river_banks = self._create_river_banks(curve_obj, width, depth)
+        river_banks = self._create_river_banks(curve_obj, paths, width, depth)
        
         return {
             'river_bed': river_bed,
@@ -697,9 +1175,8 @@ class RAGE_OT_GenerateRiver(Operator):
             'depth': depth
         }
    
-    def _create_river_bed(self, curve_obj, width: float, depth: float):
+    def _create_river_bed(self, curve_obj, paths: list, width: float, depth: float):
         """Professional river bed geometry"""
-        # Convert curve to mesh professionally
         river_mesh = bpy.data.meshes.new("RDR_River_Bed_Professional")
         river_obj = bpy.data.objects.new("RDR_River_Bed_Professional", river_mesh)
        
@@ -707,22 +1184,9 @@ class RAGE_OT_GenerateRiver(Operator):
         bpy.context.collection.objects.link(river_obj)
         river_obj.location = curve_obj.location
        
-        # Professional bmesh processing
-        bm = bmesh.new()
-        temp_mesh = curve_obj.to_mesh()
-        bm.from_mesh(temp_mesh)
-       
-        # Professional extrusion for river bed
-        extruded = bmesh.ops.extrude_edge_only(bm, edges=bm.edges)
-        bmesh.ops.scale(bm, vec=(width, width, -depth), verts=extruded['geom'])
-       
-        # Professional face creation
-        bmesh.ops.contextual_create(bm, geom=bm.edges)
-       
-        # Professional mesh finalization
-        bm.to_mesh(river_mesh)
-        bm.free()
-        bpy.data.meshes.remove(temp_mesh)
+        # Professional bed strips: each spline path joined to its scaled, lowered copy
+        _build_quad_strip_mesh(river_mesh, [(path, path * (width, width, -depth), cyclic)
+                                            for path, cyclic in paths])
        
         # Professional properties
         river_obj["rage_river_bed"] = True
@@ -731,8 +1195,54 @@ class RAGE_OT_GenerateRiver(Operator):
        
         return river_obj
    
-    def _create_river_banks(self, curve_obj, width: float, depth: float):
-        """Professional river bank creation - BASIC IMPLEMENTATION"""
+    def _sample_curve_paths(self, curve_obj) -> list:
+        """Professional per-spline curve sampling: [(coords (N, 3), cyclic), ...].
+       
+        Evaluated from a copy of the curve with bevel, extrude and fill disabled, so the
+        mesh holds only the spline centre lines, then split back into one path per spline.
+        """
+        # Professional centre-line copy (a bevelled or extruded curve evaluates to a tube surface)
+        path_curve = curve_obj.data.copy()
+        path_curve.bevel_depth = 0.0
+        path_curve.extrude = 0.0
+        path_curve.bevel_object = None
+        if path_curve.dimensions == '2D':
+            path_curve.fill_mode = 'NONE'
+        path_obj = bpy.data.objects.new("RDR_River_Path_Temp", path_curve)
+        try:
+            path_mesh = bpy.data.meshes.new_from_object(path_obj)
+        finally:
+            bpy.data.objects.remove(path_obj)
+            bpy.data.curves.remove(path_curve)
+       
+        try:
+            coords = np.empty(len(path_mesh.vertices) * 3, dtype=np.float32)
+            path_mesh.vertices.foreach_get("co", coords)
+            edges = np.empty(len(path_mesh.edges) * 2, dtype=np.int32)
+            path_mesh.edges.foreach_get("vertices", edges)
+        finally:
+            bpy.data.meshes.remove(path_mesh)
+        coords = coords.reshape(-1, 3)
+        edges = np.sort(edges.reshape(-1, 2), axis=1)
+       
+        # Each spline is a contiguous vertex run joined by (i, i + 1) edges; cyclic splines
+        # also carry the closing (first, last) edge
+        consecutive = edges[edges[:, 1] == edges[:, 0] + 1, 0]
+        linked = np.zeros(len(coords), dtype=bool)
+        linked[consecutive] = True
+        edge_set = set(map(tuple, edges.tolist()))
+       
+        paths = []
+        for run in np.split(np.arange(len(coords)), np.flatnonzero(~linked[:-1]) + 1):
+            if len(run) < 2:
+                continue
+            cyclic = len(run) >= 3 and (int(run[0]), int(run[-1])) in edge_set
+            paths.append((coords[run[0]:run[-1] + 1], cyclic))
+       
+        return paths
+   
+    def _create_river_banks(self, curve_obj, paths: list, width: float, depth: float):
+        """Professional river bank creation along the curve path"""
         try:
             river_bank_mesh = bpy.data.meshes.new("RDR_River_Bank_Professional")
             river_bank_obj = bpy.data.objects.new("RDR_River_Bank_Professional", river_bank_mesh)
@@ -741,26 +1251,26 @@ class RAGE_OT_GenerateRiver(Operator):
             bpy.context.collection.objects.link(river_bank_obj)
             river_bank_obj.location = curve_obj.location
            
-            # Basic bank geometry implementation
-            bm = bmesh.new()
-           
-            # Create simple bank geometry
-            for i in range(10):
-                bm.verts.new((i * width/10, 0, 0))
-                bm.verts.new((i * width/10, width/2, depth/2))
-           
-            bm.verts.ensure_lookup_table()
-           
-            # Create faces
-            for i in range(9):
-                v1 = bm.verts[i*2]
-                v2 = bm.verts[i*2+1]
-                v3 = bm.verts[i*2+3]
-                v4 = bm.verts[i*2+2]
-                bm.faces.new((v1, v2, v3, v4))
-           
-            bm.to_mesh(river_bank_mesh)
-            bm.free()
+            # Professional bank path (one bank segment per evaluated curve point, per spline)
+            if not paths:
+                path = np.zeros((10, 3), dtype=np.float32)
+                path[:, 0] = np.arange(10) * width / 10
+                paths = [(path, False)]
+           
+            # Professional bank rows: river edge rising outward to the bank top
+            strips = []
+            for path, cyclic in paths:
+                if cyclic:
+                    tangent = np.roll(path, -1, axis=0) - np.roll(path, 1, axis=0)
+                else:
+                    tangent = np.gradient(path, axis=0)
+                side = np.cross((0.0, 0.0, 1.0), tangent)
+                side /= np.maximum(np.linalg.norm(side, axis=1, keepdims=True), 1e-8)
+                river_edge = path + side * (width / 2)
+                bank_top = path + side * width + (0.0, 0.0, depth / 2)
+                strips.append((river_edge, bank_top, cyclic))
+           
+            _build_quad_strip_mesh(river_bank_mesh, strips)
            
             river_bank_obj["rage_river_bank"] = True
            
@@ -774,9 +1284,7 @@ class RAGE_OT_GenerateRiver(Operator):
         river_bed = river_data['river_bed']
        
         # Professional water plane creation
-        bpy.ops.mesh.primitive_plane_add(size=river_data['width'] * 2)
-        water_obj = bpy.context.active_object
-        water_obj.name = "RDR_River_Water_Professional"
+        water_obj = _fast_plane("RDR_River_Water_Professional", river_data['width'] * 2)
        
         # Professional positioning
         water_obj.location = river_bed.location
@@ -796,37 +1304,47 @@ class RAGE_OT_GenerateRiver(Operator):
         return water_obj
    
     def _create_water_material(self, water_obj, flow_speed: float):
-        """Professional water material creation"""
-        try:
-            mat = bpy.data.materials.new(name="RDR_Water_Material_Professional")
-            mat.use_nodes = True
-            nodes = mat.node_tree.nodes
-            links = mat.node_tree.links
-           
-            # Professional node cleanup
-            nodes.clear()
-           
-            # Professional water shader setup
-            output_node = nodes.new(type='ShaderNodeOutputMaterial')
-            bsdf_node = nodes.new(type='ShaderNodeBsdfPrincipled')
-            bsdf_node.inputs['Base Color'].default_value = (0.2, 0.5, 0.8, 1.0)  # Professional water color
-            bsdf_node.inputs['Roughness'].default_value = 0.1
-            bsdf_node.inputs['Specular'].default_value = 0.9
-            bsdf_node.inputs['Transmission'].default_value = 0.8
-           
-            # Professional node connections
-            links.new(bsdf_node.outputs['BSDF'], output_node.inputs['Surface'])
-           
-            # Professional material assignment
-            if water_obj.data.materials:
-                water_obj.data.materials[0] = mat
-            else:
-                water_obj.data.materials.append(mat)
-           
-            print("✅ Professional water material created")
-               
-        except Exception as e:
-            print(f"⚠️ Water material creation failed: {e}")
+        """Professional water material creation (one shared material for all rivers)"""
+        mat = bpy.data.materials.get("RDR_Water_Material_Professional")
+        if mat is None:
+            mat = self._build_water_material()
+       
+        # Professional per-river copy of the shared template (no node tree rebuild)
+        if self.unique_material:
+            mat = mat.copy()
+       
+        # Professional material assignment
+        if water_obj.data.materials:
+            water_obj.data.materials[0] = mat
+        else:
+            water_obj.data.materials.append(mat)
+       
+        print("✅ Professional water material created")
+   
+    def _build_water_material(self):
+        """Professional water shader node tree"""
+        mat = bpy.data.materials.new(name="RDR_Water_Material_Professional")
+        mat.use_nodes = True
+        nodes = mat.node_tree.nodes
+        links = mat.node_tree.links
+       
+        # Professional node cleanup
+        nodes.clear()
+       
+        # Professional water shader setup
+        output_node = nodes.new(type='ShaderNodeOutputMaterial')
+        bsdf_node = nodes.new(type='ShaderNodeBsdfPrincipled')
+        _set_bsdf_inputs(bsdf_node, {
+            'Base Color': (0.2, 0.5, 0.8, 1.0),  # Professional water color
+            'Roughness': 0.1,
+            'Specular': 0.9,
+            'Transmission': 0.8
+        })
+       
+        # Professional node connections
+        links.new(bsdf_node.outputs['BSDF'], output_node.inputs['Surface'])
+       
+        return mat
 
 class RAGE_OT_CreateLake(Operator):
     bl_idname = "rage.create_lake"
@@ -875,133 +1393,85 @@ class RAGE_OT_CreateLake(Operator):
         return {'FINISHED'}
    
     def _create_lake_system(self, radius: float, depth: float, detail: int):
-        """Professional lake system creation"""
-        # Professional lake bed creation
-        lake_bed = self._create_lake_bed(radius, depth, detail)
+        """Professional lake system creation (bed, water and shoreline in one object)"""
+        lake_mesh = bpy.data.meshes.new("RDR_Lake_Professional")
+        self._build_lake_mesh(lake_mesh, radius, depth, detail)
+       
+        # Professional material slots: 0 = bed, 1 = water, 2 = shoreline
+        lake_mesh.materials.append(None)
+        lake_mesh.materials.append(self._create_lake_water_material())
+        lake_mesh.materials.append(None)
        
-        # Professional water surface creation
-        water_surface = self._create_water_surface(radius, depth, detail)
+        lake_obj = bpy.data.objects.new("RDR_Lake_Professional", lake_mesh)
+        bpy.context.collection.objects.link(lake_obj)
        
-        # Professional shoreline creation
-        shoreline = self._create_shoreline(radius, depth, detail)
+        # Professional properties
+        lake_obj["rage_lake_bed"] = True
+        lake_obj["rage_shoreline"] = True
+        lake_obj["lake_radius"] = radius
+        lake_obj["lake_depth"] = depth
+        lake_obj["rage_water"] = True
+        lake_obj["water_type"] = "LAKE"
        
         return {
-            'lake_bed': lake_bed,
-            'water_surface': water_surface,
-            'shoreline': shoreline,
+            'lake': lake_obj,
             'radius': radius,
             'depth': depth
         }
    
-    def _create_lake_bed(self, radius: float, depth: float, detail: int):
-        """Professional lake bed geometry"""
-        # Create professional dish-shaped lake bed
-        bpy.ops.mesh.primitive_cylinder_add(
-            vertices=detail,
-            radius=radius,
-            depth=depth,
-            location=(0, 0, -depth/2)
+    def _build_lake_mesh(self, mesh: bpy.types.Mesh, radius: float, depth: float, detail: int):
+        """Professional fused lake geometry with one material index per region"""
+        parts = (
+            _bowl_geometry(radius, depth, detail, max(2, detail // 4)),  # Dish-shaped bed, rim at z=0
+            _cylinder_geometry(radius, 0.1, detail),                     # Water surface slab
+            self._shoreline_geometry(radius, depth, detail),             # Shoreline fan
         )
        
-        lake_bed = bpy.context.active_object
-        lake_bed.name = "RDR_Lake_Bed_Professional"
-       
-        # Professional shaping (create bowl shape)
-        bpy.ops.object.mode_set(mode='EDIT')
-        bpy.ops.mesh.select_all(action='SELECT')
-       
-        # Professional proportional editing for natural shape
-        bpy.context.tool_settings.use_proportional_edit = True
-        bpy.context.tool_settings.proportional_size = radius * 0.8
-       
-        bpy.ops.object.mode_set(mode='OBJECT')
-       
-        # Professional properties
-        lake_bed["rage_lake_bed"] = True
-        lake_bed["lake_radius"] = radius
-        lake_bed["lake_depth"] = depth
-       
-        return lake_bed
-   
-    def _create_water_surface(self, radius: float, depth: float, detail: int):
-        """Professional water surface creation"""
-        # Create professional water plane
-        bpy.ops.mesh.primitive_cylinder_add(
-            vertices=detail,
-            radius=radius,
-            depth=0.1,
-            location=(0, 0, 0)
-        )
+        verts, faces, material_indices = [], [], []
+        offset = 0
+        for slot, (part_verts, part_faces) in enumerate(parts):
+            if isinstance(part_faces, np.ndarray):
+                part_faces = (part_faces,)
+            for block in part_faces:
+                faces.append(block + offset)
+                material_indices.append(np.full(len(block), slot, dtype=np.int32))
+            verts.append(part_verts)
+            offset += len(part_verts)
        
-        water_surface = bpy.context.active_object
-        water_surface.name = "RDR_Lake_Water_Professional"
+        # Professional top-down 0-1 UVs over the whole lake footprint (shoreline ring included)
+        verts = np.concatenate(verts)
+        uvs = verts[:, :2] / (2 * radius * 1.1) + 0.5
        
-        # Professional water material
-        self._create_lake_water_material(water_surface)
+        _fast_mesh_build(mesh, verts, faces, uvs)
+        mesh.polygons.foreach_set("material_index", np.concatenate(material_indices))
+   
+    def _shoreline_geometry(self, radius: float, depth: float, detail: int):
+        """Professional shoreline geometry - BASIC IMPLEMENTATION"""
+        # Create circular shoreline (ring of `detail` verts plus one shared apex)
+        angles = np.linspace(0.0, 2 * np.pi, detail, endpoint=False, dtype=np.float32)
+        verts = np.zeros((detail + 1, 3), dtype=np.float32)
+        verts[:detail, 0] = radius * 1.1 * np.cos(angles)
+        verts[:detail, 1] = radius * 1.1 * np.sin(angles)
+        verts[detail, 2] = -depth / 4
        
-        # Professional properties
-        water_surface["rage_water"] = True
-        water_surface["water_type"] = "LAKE"
+        # Create faces (triangle fan from each ring edge to the apex)
+        ring = np.arange(detail, dtype=np.int32)
+        faces = np.stack((ring, np.roll(ring, -1), np.full(detail, detail, dtype=np.int32)), axis=-1)
        
-        return water_surface
+        return verts, faces
    
-    def _create_shoreline(self, radius: float, depth: float, detail: int):
-        """Professional shoreline creation - BASIC IMPLEMENTATION"""
-        try:
-            shoreline_mesh = bpy.data.meshes.new("RDR_Shoreline_Professional")
-            shoreline_obj = bpy.data.objects.new("RDR_Shoreline_Professional", shoreline_mesh)
-           
-            bpy.context.collection.objects.link(shoreline_obj)
-           
-            # Create basic shoreline geometry
-            bm = bmesh.new()
-           
-            # Create circular shoreline
-            for i in range(detail):
-                angle = (i / detail) * 2 * 3.14159
-                x = radius * 1.1 * np.cos(angle)
-                y = radius * 1.1 * np.sin(angle)
-                bm.verts.new((x, y, 0))
-           
-            bm.verts.ensure_lookup_table()
-           
-            # Create faces
-            for i in range(detail):
-                next_i = (i + 1) % detail
-                v1 = bm.verts[i]
-                v2 = bm.verts[next_i]
-                v3 = bm.verts.new((0, 0, -depth/4))
-                bm.faces.new((v1, v2, v3))
-           
-            bm.to_mesh(shoreline_mesh)
-            bm.free()
-           
-            shoreline_obj["rage_shoreline"] = True
-           
-            print("✅ Professional shoreline generated")
-            return shoreline_obj
-        except Exception as e:
-            print(f"Shoreline creation failed: {e}")
-            return None
-   
-    def _create_lake_water_material(self, water_obj):
-        """Professional lake water material"""
-        try:
+    def _create_lake_water_material(self):
+        """Professional lake water material (one shared material for all lakes)"""
+        mat = bpy.data.materials.get("RDR_Lake_Water_Material_Professional")
+        if mat is None:
             mat = bpy.data.materials.new(name="RDR_Lake_Water_Material_Professional")
             mat.use_nodes = True
            
             # Professional lake water shader setup
             # Similar to river water but with different properties
-           
-            if water_obj.data.materials:
-                water_obj.data.materials[0] = mat
-            else:
-                water_obj.data.materials.append(mat)
-           
-            print("✅ Professional lake water material created")
-               
-        except Exception as e:
-            print(f"⚠️ Lake water material creation failed: {e}")
+       
+        print("✅ Professional lake water material created")
+        return mat
 
 class RAGE_OT_GenerateOcean(Operator):
     bl_idname = "rage.generate_ocean"
@@ -1066,66 +1536,72 @@ class RAGE_OT_GenerateOcean(Operator):
     def _create_ocean_surface(self, size: float, wave_height: float, wave_scale: float):
         """Professional ocean surface geometry"""
         # Create professional ocean plane
-        bpy.ops.mesh.primitive_plane_add(size=size)
-        ocean_surface = bpy.context.active_object
-        ocean_surface.name = "RDR_Ocean_Professional"
+        # Professional grid density (about four samples per wave, capped for huge oceans)
+        segments = int(np.clip(size / wave_scale * 4, 16, 512))
+        coords = np.linspace(-size / 2, size / 2, segments + 1, dtype=np.float32)
+        xs, ys = np.meshgrid(coords, coords)
        
-        # Professional subdivision for wave detail
-        subdiv_mod = ocean_surface.modifiers.new(name="Ocean_Subdivision", type='SUBSURF')
-        subdiv_mod.levels = 3
+        # Professional baked wave displacement (static mesh, no modifier evaluation per frame)
+        verts = np.stack((xs, ys, _ocean_wave_heights(coords, coords, wave_height, wave_scale)), axis=-1)
+        index = np.arange((segments + 1) ** 2, dtype=np.int32).reshape(segments + 1, segments + 1)
+        faces = np.stack((index[:-1, :-1], index[:-1, 1:], index[1:, 1:], index[1:, :-1]), axis=-1)
        
-        # Professional displacement for waves
-        displace_mod = ocean_surface.modifiers.new(name="Ocean_Displacement", type='DISPLACE')
+        # Professional 0-1 UVs across the ocean grid (for wave normal map sampling)
+        uvs = np.stack((xs, ys), axis=-1).reshape(-1, 2) / size + 0.5
        
-        # Professional wave texture setup
-        wave_texture = bpy.data.textures.new("Ocean_Waves_Professional", type='CLOUDS')
-        wave_texture.noise_scale = wave_scale
-        displace_mod.texture = wave_texture
-        displace_mod.strength = wave_height
+        ocean_surface = _fast_object("RDR_Ocean_Professional", verts.reshape(-1, 3), faces.reshape(-1, 4),
+                                     uvs=uvs)
        
         # Professional properties
         ocean_surface["rage_ocean"] = True
         ocean_surface["ocean_size"] = size
         ocean_surface["wave_height"] = wave_height
+        ocean_surface["wave_scale"] = wave_scale
        
         return ocean_surface
    
     def _create_ocean_material(self, ocean_obj, wave_height: float, wave_scale: float):
-        """Professional ocean material creation"""
-        try:
-            mat = bpy.data.materials.new(name="RDR_Ocean_Material_Professional")
-            mat.use_nodes = True
-            nodes = mat.node_tree.nodes
-            links = mat.node_tree.links
-           
-            # Professional node cleanup
-            nodes.clear()
-           
-            # Professional ocean shader setup
-            output_node = nodes.new(type='ShaderNodeOutputMaterial')
-            bsdf_node = nodes.new(type='ShaderNodeBsdfPrincipled')
-           
-            # Professional ocean properties
-            bsdf_node.inputs['Base Color'].default_value = (0.1, 0.3, 0.6, 1.0)  # Deep ocean color
-            bsdf_node.inputs['Roughness'].default_value = 0.2
-            bsdf_node.inputs['Specular'].default_value = 0.8
-            bsdf_node.inputs['Transmission'].default_value = 0.9
-           
-            # Professional wave normal mapping would go here
-           
-            # Professional node connections
-            links.new(bsdf_node.outputs['BSDF'], output_node.inputs['Surface'])
-           
-            # Professional material assignment
-            if ocean_obj.data.materials:
-                ocean_obj.data.materials[0] = mat
-            else:
-                ocean_obj.data.materials.append(mat)
-           
-            print("✅ Professional ocean material created")
-               
-        except Exception as e:
-            print(f"⚠️ Ocean material creation failed: {e}")
+        """Professional ocean material creation (one shared material for all oceans)"""
+        mat = bpy.data.materials.get("RDR_Ocean_Material_Professional")
+        if mat is None:
+            mat = self._build_ocean_material()
+       
+        # Professional material assignment
+        if ocean_obj.data.materials:
+            ocean_obj.data.materials[0] = mat
+        else:
+            ocean_obj.data.materials.append(mat)
+       
+        print("✅ Professional ocean material created")
+   
+    def _build_ocean_material(self):
+        """Professional ocean shader node tree"""
+        mat = bpy.data.materials.new(name="RDR_Ocean_Material_Professional")
+        mat.use_nodes = True
+        nodes = mat.node_tree.nodes
+        links = mat.node_tree.links
+       
+        # Professional node cleanup
+        nodes.clear()
+       
+        # Professional ocean shader setup
+        output_node = nodes.new(type='ShaderNodeOutputMaterial')
+        bsdf_node = nodes.new(type='ShaderNodeBsdfPrincipled')
+       
+        # Professional ocean properties
+        _set_bsdf_inputs(bsdf_node, {
+            'Base Color': (0.1, 0.3, 0.6, 1.0),  # Deep ocean color
+            'Roughness': 0.2,
+            'Specular': 0.8,
+            'Transmission': 0.9
+        })
+       
+        # Professional wave normal mapping would go here
+       
+        # Professional node connections
+        links.new(bsdf_node.outputs['BSDF'], output_node.inputs['Surface'])
+       
+        return mat
 
 # Professional registration
 classes = (
@@ -1139,24 +1615,15 @@ classes = (
     RAGE_OT_GenerateOcean,
 )
 
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
+
 def register():
     """Professional terrain tools registration"""
-    # Register properties first
-    bpy.utils.register_class(RAGE_Studio_Properties)
+    # Properties are first in `classes`, so the pointer type exists before it is used
+    _register_classes()
     bpy.types.Scene.rage_studio = PointerProperty(type=RAGE_Studio_Properties)
-   
-    # Then register operators
-    for cls in classes:
-        try:
-            bpy.utils.register_class(cls)
-        except Exception as e:
-            print(f"❌ Failed to register terrain tool {cls.__name__}: {e}")
-            raise
 
 def unregister():
     """Professional terrain tools unregistration"""
-    for cls in reversed(classes):
-        try:
-            bpy.utils.unregister_class(cls)
-        except Exception as e:
-            print(f"⚠️ Failed to unregister terrain tool {cls.__name__}: {e}")
\ No newline at end of file
+    del bpy.types.Scene.rage_studio
+    _unregister_classes()
\ No newline at end of file
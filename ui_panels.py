@@ -1,8 +1,15 @@
 # RAGE Studio Suite - Professional UI Panel System
 import bpy
 import os
+from functools import lru_cache
 from bpy.types import Panel, Menu, UIList
 from bpy.props import StringProperty, BoolProperty, IntProperty
+from .properties import cached_path_exists
+
+@lru_cache(maxsize=8)
+def _display_basename(path: str) -> str:
+    """Professional memoized basename for labels redrawn every frame"""
+    return os.path.basename(path)
 
 class RAGE_PT_MainPanel(Panel):
     bl_label = "RAGE Studio Suite"
@@ -35,11 +42,11 @@ class RAGE_PT_MainPanel(Panel):
         box = layout.box()
         box.label(text="Essential Settings", icon='SETTINGS')
         box.prop(props, "game_directory")
-        if props.game_directory and not os.path.exists(props.game_directory):
+        if props.game_directory and not cached_path_exists(props.game_directory):
             box.label(text="⚠️ Game directory not found", icon='ERROR')
        
         box.prop(props, "export_path")
-        if props.export_path and not os.path.exists(props.export_path):
+        if props.export_path and not cached_path_exists(props.export_path):
             box.label(text="⚠️ Export path not found", icon='ERROR')
 
 class RAGE_PT_ImportPanel(Panel):
@@ -49,6 +56,7 @@ class RAGE_PT_ImportPanel(Panel):
     bl_region_type = 'UI'
     bl_category = "RAGE"
     bl_parent_id = "RAGE_PT_main_panel"
+    bl_options = {'DEFAULT_CLOSED'}
     bl_order = 2
 
     def draw(self, context):
@@ -64,14 +72,15 @@ class RAGE_PT_ImportPanel(Panel):
         col.operator("rage.import_heightmap", icon='TEXTURE', text="Import Heightmap")
        
         # Import Settings
+        import_settings = props.import_settings
         box = layout.box()
         box.label(text="Import Settings", icon='PREFERENCES')
-        box.prop(props.import_settings, "auto_scale")
-        box.prop(props.import_settings, "import_textures")
-        box.prop(props.import_settings, "create_materials")
-        box.prop(props.import_settings, "import_lods")
-        box.prop(props.import_settings, "import_collision")
-        box.prop(props.import_settings, "merge_vertices")
+        box.prop(import_settings, "auto_scale")
+        box.prop(import_settings, "import_textures")
+        box.prop(import_settings, "create_materials")
+        box.prop(import_settings, "import_lods")
+        box.prop(import_settings, "import_collision")
+        box.prop(import_settings, "merge_vertices")
 
 class RAGE_PT_ExportPanel(Panel):
     bl_label = "Export Tools"
@@ -80,6 +89,7 @@ class RAGE_PT_ExportPanel(Panel):
     bl_region_type = 'UI'
     bl_category = "RAGE"
     bl_parent_id = "RAGE_PT_main_panel"
+    bl_options = {'DEFAULT_CLOSED'}
     bl_order = 3
 
     def draw(self, context):
@@ -95,20 +105,21 @@ class RAGE_PT_ExportPanel(Panel):
         col.operator("rage.export_to_codewalker", icon='WORLD_DATA', text="Export to CodeWalker")
        
         # Export Settings
+        export_settings = props.export_settings
         box = layout.box()
         box.label(text="Export Settings", icon='SETTINGS')
-        box.prop(props.export_settings, "scale_factor")
-        box.prop(props.export_settings, "apply_modifiers")
-        box.prop(props.export_settings, "export_lods")
-        box.prop(props.export_settings, "optimize_mesh")
-        box.prop(props.export_settings, "export_collision")
+        box.prop(export_settings, "scale_factor")
+        box.prop(export_settings, "apply_modifiers")
+        box.prop(export_settings, "export_lods")
+        box.prop(export_settings, "optimize_mesh")
+        box.prop(export_settings, "export_collision")
        
         # Advanced Export
         box = layout.box()
         box.label(text="Advanced Settings", icon='MODIFIER')
-        box.prop(props.export_settings, "split_large_meshes")
-        if props.export_settings.split_large_meshes:
-            box.prop(props.export_settings, "mesh_split_threshold")
+        box.prop(export_settings, "split_large_meshes")
+        if export_settings.split_large_meshes:
+            box.prop(export_settings, "mesh_split_threshold")
 
 class RAGE_PT_TerrainPanel(Panel):
     bl_label = "Terrain Tools"
@@ -117,6 +128,7 @@ class RAGE_PT_TerrainPanel(Panel):
     bl_region_type = 'UI'
     bl_category = "RAGE"
     bl_parent_id = "RAGE_PT_main_panel"
+    bl_options = {'DEFAULT_CLOSED'}
     bl_order = 4
 
     def draw(self, context):
@@ -139,25 +151,26 @@ class RAGE_PT_TerrainPanel(Panel):
         col.operator("rage.excavate_area", icon='MESH_CUBE', text="Excavate Area")
        
         # Terrain Settings
+        terrain_settings = props.terrain_settings
         box = layout.box()
         box.label(text="Terrain Settings", icon='PREFERENCES')
-        box.prop(props.terrain_settings, "heightmap_resolution")
-        box.prop(props.terrain_settings, "height_scale")
-        box.prop(props.terrain_settings, "tile_size")
-        box.prop(props.terrain_settings, "lod_levels")
-        box.prop(props.terrain_settings, "auto_generate_collision")
+        box.prop(terrain_settings, "heightmap_resolution")
+        box.prop(terrain_settings, "height_scale")
+        box.prop(terrain_settings, "tile_size")
+        box.prop(terrain_settings, "lod_levels")
+        box.prop(terrain_settings, "auto_generate_collision")
        
         # Active Terrain
         if props.terrain_object:
             box = layout.box()
             box.label(text="Active Terrain", icon='OBJECT_DATA')
             box.prop_search(props, "terrain_object", bpy.data, "objects", text="")
-            if props.terrain_object in bpy.data.objects:
-                obj = bpy.data.objects[props.terrain_object]
+            obj = bpy.data.objects.get(props.terrain_object)
+            if obj is not None:
                 if obj.get("rage_terrain"):
-                    box.label(text=f"✅ Valid terrain object", icon='CHECKMARK')
+                    box.label(text="✅ Valid terrain object", icon='CHECKMARK')
                 else:
-                    box.label(text=f"⚠️ Not a terrain object", icon='ERROR')
+                    box.label(text="⚠️ Not a terrain object", icon='ERROR')
 
 class RAGE_PT_RoadPanel(Panel):
     bl_label = "Road & Path Tools"
@@ -166,6 +179,7 @@ class RAGE_PT_RoadPanel(Panel):
     bl_region_type = 'UI'
     bl_category = "RAGE"
     bl_parent_id = "RAGE_PT_main_panel"
+    bl_options = {'DEFAULT_CLOSED'}
     bl_order = 5
 
     def draw(self, context):
@@ -183,25 +197,26 @@ class RAGE_PT_RoadPanel(Panel):
         col.operator("rage.generate_river", icon='MOD_OCEAN', text="Generate River")
        
         # Road Settings
+        road_settings = props.road_settings
         box = layout.box()
         box.label(text="Road Settings", icon='SETTINGS')
-        box.prop(props.road_settings, "road_width")
-        box.prop(props.road_settings, "road_segments")
-        box.prop(props.road_settings, "bevel_depth")
-        box.prop(props.road_settings, "auto_uv")
-        box.prop(props.road_settings, "create_collision")
+        box.prop(road_settings, "road_width")
+        box.prop(road_settings, "road_segments")
+        box.prop(road_settings, "bevel_depth")
+        box.prop(road_settings, "auto_uv")
+        box.prop(road_settings, "create_collision")
        
         # Active Road
         if props.active_road_curve:
             box = layout.box()
             box.label(text="Active Road", icon='CURVE_DATA')
             box.prop_search(props, "active_road_curve", bpy.data, "objects", text="")
-            if props.active_road_curve in bpy.data.objects:
-                obj = bpy.data.objects[props.active_road_curve]
+            obj = bpy.data.objects.get(props.active_road_curve)
+            if obj is not None:
                 if obj.type == 'CURVE':
-                    box.label(text=f"✅ Valid curve object", icon='CHECKMARK')
+                    box.label(text="✅ Valid curve object", icon='CHECKMARK')
                 else:
-                    box.label(text=f"⚠️ Not a curve object", icon='ERROR')
+                    box.label(text="⚠️ Not a curve object", icon='ERROR')
 
 class RAGE_PT_CodeWalkerPanel(Panel):
     bl_label = "CodeWalker Tools"
@@ -210,6 +225,7 @@ class RAGE_PT_CodeWalkerPanel(Panel):
     bl_region_type = 'UI'
     bl_category = "RAGE"
     bl_parent_id = "RAGE_PT_main_panel"
+    bl_options = {'DEFAULT_CLOSED'}
     bl_order = 6
 
     def draw(self, context):
@@ -228,9 +244,9 @@ class RAGE_PT_CodeWalkerPanel(Panel):
         box = layout.box()
         box.label(text="CodeWalker Settings", icon='PREFERENCES')
         box.prop(props, "codewalker_directory")
-        if props.codewalker_directory and not os.path.exists(props.codewalker_directory):
+        if props.codewalker_directory and not cached_path_exists(props.codewalker_directory):
             box.label(text="⚠️ CodeWalker directory not found", icon='ERROR')
-        elif props.codewalker_directory and os.path.exists(props.codewalker_directory):
+        elif props.codewalker_directory:
             box.label(text="✅ CodeWalker directory found", icon='CHECKMARK')
 
 class RAGE_PT_AssetBrowserPanel(Panel):
@@ -240,6 +256,7 @@ class RAGE_PT_AssetBrowserPanel(Panel):
     bl_region_type = 'UI'
     bl_category = "RAGE"
     bl_parent_id = "RAGE_PT_main_panel"
+    bl_options = {'DEFAULT_CLOSED'}
     bl_order = 7
 
     def draw(self, context):
@@ -250,7 +267,7 @@ class RAGE_PT_AssetBrowserPanel(Panel):
         box = layout.box()
         box.label(text="Asset Management", icon='ASSET_MANAGER')
        
-        if props.game_directory and os.path.exists(props.game_directory):
+        if props.game_directory and cached_path_exists(props.game_directory):
             col = box.column(align=True)
             col.operator("rage.scan_game_assets", icon='FILE_FOLDER', text="Scan Game Assets")
             col.operator("rage.build_asset_library", icon='OUTLINER', text="Build Asset Library")
@@ -275,6 +292,7 @@ class RAGE_PT_AdvancedPanel(Panel):
     bl_region_type = 'UI'
     bl_category = "RAGE"
     bl_parent_id = "RAGE_PT_main_panel"
+    bl_options = {'DEFAULT_CLOSED'}
     bl_order = 8
 
     def draw(self, context):
@@ -288,7 +306,7 @@ class RAGE_PT_AdvancedPanel(Panel):
         col.operator("rage.analyze_file", icon='TEXT', text="Analyze RDR1 File")
        
         if props.last_analyzed_file:
-            box.label(text=f"Last: {os.path.basename(props.last_analyzed_file)}", icon='FILE_BLANK')
+            box.label(text=f"Last: {_display_basename(props.last_analyzed_file)}", icon='FILE_BLANK')
        
         # Mesh Processing
         box = layout.box()
@@ -314,27 +332,26 @@ class RAGE_PT_AdvancedPanel(Panel):
 class RAGE_UL_AssetList(UIList):
     """Professional asset list for displaying game assets"""
    
+    # Icon per asset type, built once instead of per drawn item
+    _ICONS = {
+        'MODEL': 'MESH_DATA',
+        'TEXTURE': 'TEXTURE',
+        'MAP': 'WORLD_DATA',
+        'VEHICLE': 'CAR',
+        'WEAPON': 'OBJECT_DATA',
+        'PED': 'USER',
+        'TERRAIN': 'MOD_OCEAN',
+        'ROAD': 'MOD_CURVE',
+    }
+   
     def draw_item(self, context, layout, data, item, icon, active_data, active_propname):
+        asset_icon = self._ICONS.get(item.type, 'ASSET_MANAGER')
         if self.layout_type in {'DEFAULT', 'COMPACT'}:
-            layout.label(text=item.name, icon=self._get_asset_icon(item.type))
+            layout.label(text=item.name, icon=asset_icon)
             layout.label(text=item.type)
         elif self.layout_type in {'GRID'}:
             layout.alignment = 'CENTER'
-            layout.label(text="", icon=self._get_asset_icon(item.type))
-
-    def _get_asset_icon(self, asset_type):
-        """Get appropriate icon for asset type"""
-        icons = {
-            'MODEL': 'MESH_DATA',
-            'TEXTURE': 'TEXTURE',
-            'MAP': 'WORLD_DATA',
-            'VEHICLE': 'CAR',
-            'WEAPON': 'OBJECT_DATA',
-            'PED': 'USER',
-            'TERRAIN': 'MOD_OCEAN',
-            'ROAD': 'MOD_CURVE',
-        }
-        return icons.get(asset_type, 'ASSET_MANAGER')
+            layout.label(text="", icon=asset_icon)
 
 class RAGE_MT_AssetMenu(Menu):
     bl_label = "Asset Operations"
@@ -362,19 +379,19 @@ classes = (
     RAGE_MT_AssetMenu,
 )
 
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
+
 def register():
     """Professional UI registration"""
-    for cls in classes:
-        try:
-            bpy.utils.register_class(cls)
-        except Exception as e:
-            print(f"❌ Failed to register UI panel {cls.__name__}: {e}")
-            raise
+    try:
+        _register_classes()
+    except Exception as e:
+        print(f"❌ Failed to register UI panels: {e}")
+        raise
 
 def unregister():
     """Professional UI unregistration"""
-    for cls in reversed(classes):
-        try:
-            bpy.utils.unregister_class(cls)
-        except Exception as e:
-            print(f"⚠️ Failed to unregister UI panel {cls.__name__}: {e}")
\ No newline at end of file
+    try:
+        _unregister_classes()
+    except Exception as e:
+        print(f"⚠️ Failed to unregister UI panels: {e}")
\ No newline at end of file
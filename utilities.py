@@ -2,14 +2,21 @@
 import bpy
 import os
 import sys
-import importlib
-import subprocess
-import json
-import datetime
+from functools import lru_cache
 from bpy.types import Operator, Panel
 from bpy.props import (StringProperty, BoolProperty, IntProperty,
                        FloatProperty, EnumProperty)
 
+@lru_cache(maxsize=None)
+def _directory_opener():
+    """Professional platform directory opener, resolved once (subprocess imported only off Windows)"""
+    if sys.platform == "win32":
+        return os.startfile
+   
+    import subprocess
+    command = "open" if sys.platform == "darwin" else "xdg-open"  # macOS / Linux
+    return lambda path: subprocess.Popen([command, path])
+
 class RAGE_OT_OpenGameDirectory(Operator):
     bl_idname = "rage.open_game_directory"
     bl_label = "Open Game Directory"
@@ -24,12 +31,7 @@ class RAGE_OT_OpenGameDirectory(Operator):
        
         try:
             # Professional directory opening
-            if sys.platform == "win32":
-                os.startfile(props.game_directory)
-            elif sys.platform == "darwin":  # macOS
-                subprocess.Popen(["open", props.game_directory])
-            else:  # Linux
-                subprocess.Popen(["xdg-open", props.game_directory])
+            _directory_opener()(props.game_directory)
            
             self.report({'INFO'}, f"Professional directory opened: {props.game_directory}")
            
@@ -107,8 +109,8 @@ class RAGE_OT_ValidateScene(Operator):
             obj_validation['suggestions'].extend(mesh_validation['suggestions'])
        
         # Professional scale validation
-        scale = obj.scale
-        if abs(scale.x - 1.0) > 0.001 or abs(scale.y - 1.0) > 0.001 or abs(scale.z - 1.0) > 0.001:
+        scale_x, scale_y, scale_z = obj.scale
+        if max(abs(scale_x - 1.0), abs(scale_y - 1.0), abs(scale_z - 1.0)) > 0.001:
             obj_validation['warnings'].append(f"Object '{obj.name}' has non-uniform scale")
        
         return obj_validation
@@ -129,8 +131,8 @@ class RAGE_OT_ValidateScene(Operator):
             mesh_validation['is_valid'] = False
             mesh_validation['errors'].append(f"Mesh '{obj.name}' exceeds vertex limit (65,535)")
        
-        # Professional triangle count validation
-        triangle_count = sum(len(poly.vertices) - 2 for poly in mesh.polygons)
+        # Professional triangle count validation (sum of n - 2 per polygon == loops - 2 * polygons)
+        triangle_count = len(mesh.loops) - 2 * len(mesh.polygons)
         if triangle_count > 100000:
             mesh_validation['warnings'].append(f"Mesh '{obj.name}' has high triangle count: {triangle_count:,}")
        
@@ -145,30 +147,26 @@ class RAGE_OT_ValidateScene(Operator):
         return mesh_validation
    
     def _display_validation_results(self, validation_results):
-        """Professional validation results display"""
-        print("\nPROFESSIONAL SCENE VALIDATION")
-        print("=" * 50)
-        print(f"  Status: {'PASS' if validation_results['is_valid'] else 'FAIL'}")
-        print(f"  Warnings: {validation_results['warning_count']}")
-        print(f"  Errors: {len(validation_results['errors'])}")
-        print(f"  Suggestions: {len(validation_results['suggestions'])}")
+        """Professional validation results display (buffered, written to the console once)"""
+        lines = [
+            "",
+            "PROFESSIONAL SCENE VALIDATION",
+            "=" * 50,
+            f"  Status: {'PASS' if validation_results['is_valid'] else 'FAIL'}",
+            f"  Warnings: {validation_results['warning_count']}",
+            f"  Errors: {len(validation_results['errors'])}",
+            f"  Suggestions: {len(validation_results['suggestions'])}",
+        ]
        
-        if validation_results['errors']:
-            print("\n  ERRORS:")
-            for error in validation_results['errors']:
-                print(f"    - {error}")
+        for title, key in (("ERRORS", 'errors'), ("WARNINGS", 'warnings'), ("SUGGESTIONS", 'suggestions')):
+            if validation_results[key]:
+                lines.append(f"\n  {title}:")
+                lines.extend(f"    - {entry}" for entry in validation_results[key])
        
-        if validation_results['warnings']:
-            print("\n  WARNINGS:")
-            for warning in validation_results['warnings']:
-                print(f"    - {warning}")
+        lines.append("=" * 50)
        
-        if validation_results['suggestions']:
-            print("\n  SUGGESTIONS:")
-            for suggestion in validation_results['suggestions']:
-                print(f"    - {suggestion}")
-       
-        print("=" * 50)
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
 class RAGE_OT_CleanupScene(Operator):
     bl_idname = "rage.cleanup_scene"
@@ -223,36 +221,29 @@ class RAGE_OT_CleanupScene(Operator):
    
     def _cleanup_unused_materials(self):
         """Professional unused material cleanup"""
-        materials_removed = 0
-       
-        for material in bpy.data.materials:
-            if not material.users:
-                bpy.data.materials.remove(material)
-                materials_removed += 1
+        # Snapshot first (never mutate bpy.data while iterating it), then one batched removal
+        unused_materials = [material for material in bpy.data.materials if not material.users]
+        bpy.data.batch_remove(unused_materials)
        
-        return materials_removed
+        return len(unused_materials)
    
     def _cleanup_unused_meshes(self):
         """Professional unused mesh cleanup"""
-        meshes_removed = 0
+        # Snapshot first (never mutate bpy.data while iterating it), then one batched removal
+        unused_meshes = [mesh for mesh in bpy.data.meshes if not mesh.users]
+        bpy.data.batch_remove(unused_meshes)
        
-        for mesh in bpy.data.meshes:
-            if not mesh.users:
-                bpy.data.meshes.remove(mesh)
-                meshes_removed += 1
-       
-        return meshes_removed
+        return len(unused_meshes)
    
     def _optimize_meshes(self):
         """Professional mesh optimization"""
-        meshes_optimized = 0
+        # Professional single filter pass over the scene
+        mesh_objects = [obj for obj in bpy.context.scene.objects if obj.type == 'MESH']
        
-        for obj in bpy.context.scene.objects:
-            if obj.type == 'MESH':
-                self._optimize_single_mesh(obj)
-                meshes_optimized += 1
+        for obj in mesh_objects:
+            self._optimize_single_mesh(obj)
        
-        return meshes_optimized
+        return len(mesh_objects)
    
     def _optimize_single_mesh(self, obj):
         """Professional single mesh optimization"""
@@ -313,12 +304,22 @@ class RAGE_OT_ExportDebugInfo(Operator):
    
     def _create_debug_file(self, debug_info):
         """Professional debug file creation"""
+        import datetime
+        import json
+        import tempfile
+       
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        debug_file = f"rage_studio_debug_{timestamp}.json"
+        debug_file = os.path.join(tempfile.gettempdir(), f"rage_studio_debug_{timestamp}.json")
+       
+        # Compact one-shot dumps() takes json's C encoder; pretty-print only in debug mode
+        if debug_info['rage_studio']['debug_mode']:
+            debug_text = json.dumps(debug_info, indent=2)
+        else:
+            debug_text = json.dumps(debug_info, separators=(',', ':'))
        
         try:
-            with open(debug_file, 'w') as f:
-                json.dump(debug_info, f, indent=2)
+            with open(debug_file, 'w', encoding='utf-8') as f:
+                f.write(debug_text)
            
             return debug_file
            
@@ -333,19 +334,19 @@ classes = (
     RAGE_OT_ExportDebugInfo,
 )
 
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
+
 def register():
     """Professional utilities registration"""
-    for cls in classes:
-        try:
-            bpy.utils.register_class(cls)
-        except Exception as e:
-            print(f"Failed to register utility {cls.__name__}: {e}")
-            raise
+    try:
+        _register_classes()
+    except Exception as e:
+        print(f"Failed to register utilities: {e}")
+        raise
 
 def unregister():
     """Professional utilities unregistration"""
-    for cls in reversed(classes):
-        try:
-            bpy.utils.unregister_class(cls)
-        except Exception as e:
-            print(f"Failed to unregister utility {cls.__name__}: {e}")
\ No newline at end of file
+    try:
+        _unregister_classes()
+    except Exception as e:
+        print(f"Failed to unregister utilities: {e}")
\ No newline at end of file